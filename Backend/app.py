@@ -1,19 +1,22 @@
-import json
+import functools
+import hashlib
+import itertools
 import logging
+import os
 import time 
-import uuid
-from flask import Flask, request, jsonify, g, has_request_context
+from flask import Flask, request, g, has_request_context
 from flask_cors import CORS
 from flask_limiter import Limiter 
 from flask_limiter.util import get_remote_address
-from flasgger import Swagger
-from marshmallow import Schema, fields, ValidationError
+from marshmallow import ValidationError
 from werkzeug.exceptions import HTTPException
-import pandas as pd
-import joblib
+import numpy as np
+import orjson
+import sklearn
 
 from logging_config import configure_logger
 from disease_ensemble import DiseaseEnsemble
+from batch_predictor import BatchedPredictor
 from custom_exceptions import UnknownSymptomException
 
 
@@ -29,7 +32,10 @@ CORS(app, resources={
     r"/*": {"origins": cors_allowed_url_list}
 })
 
-swagger = Swagger(app)
+# Swagger UI pulls in a sizeable import chain; production images opt out
+if os.environ.get("ENABLE_SWAGGER", "1") == "1":
+    from flasgger import Swagger
+    swagger = Swagger(app)
 
 app.config["RATELIMIT_ENABLED"] = True
 app.url_map.strict_slashes = False
@@ -38,10 +44,16 @@ app.url_map.strict_slashes = False
 # ---------------------------------------------------------
 # API Rate Limit
 # ---------------------------------------------------------
+# Counters live in Redis when REDIS_URL is set, so every gunicorn worker
+# enforces the same limit (in-memory storage counts per process). If the
+# storage is unreachable, requests are let through unlimited instead of
+# failing with a 500.
 limiter = Limiter(
     app,
     key_func=get_remote_address,
-    default_limits=["10 per minute"]
+    default_limits=["10 per minute"],
+    storage_uri=os.getenv("REDIS_URL", "memory://"),
+    swallow_errors=True
 )
 
 
@@ -55,8 +67,46 @@ logger = configure_logger()
 # Global Variables (Loaded Once at Startup)
 # ---------------------------------------------------------
 MODEL = None
+PREDICTOR = None
 DISEASE_INFO = None
 SYMPTOM_INFO = None
+SYMPTOM_INDEX = None
+N_SYMPTOMS = None
+EMPTY_SYMPTOM_VECTOR = None
+DISEASE_ENRICHED = None
+SYMPTOMS_RESPONSE_BODY = None
+SYMPTOMS_RESPONSE_ETAG = None
+
+
+# ---------------------------------------------------------
+# Precompiled Response Bodies
+# ---------------------------------------------------------
+INVALID_JSON_BODY = orjson.dumps({
+    "success": False,
+    "error": {
+        "type": "BadRequest",
+        "message": "Invalid or missing JSON body."
+    }
+})
+
+INVALID_PAYLOAD_BODY = orjson.dumps({
+    "success": False,
+    "error": {
+        "type": "ValidationError",
+        "message": "Invalid request payload."
+    }
+})
+
+INTERNAL_ERROR_BODY = orjson.dumps({
+    "success": False,
+    "error": {
+        "type": "InternalServerError",
+        "message": "An unexpected error occurred. Please try again later."
+    }
+})
+
+READY_BODY = orjson.dumps({"ready": True})
+NOT_READY_BODY = orjson.dumps({"ready": False})
 
 
 # ---------------------------------------------------------
@@ -84,16 +134,80 @@ def load_json_file(path: str):
         If the JSON is invalid.
     """
     try:
-        with open(path, "r") as f:
-            return json.load(f)
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
     except FileNotFoundError:
-        logger.error(f"JSON file not found: {path}")
+        logger.error("JSON file not found: %s", path)
         raise
-    except json.JSONDecodeError:
-        logger.error(f"Invalid JSON format in file: {path}")
+    except orjson.JSONDecodeError:
+        logger.error("Invalid JSON format in file: %s", path)
         raise
 
 
+def ojsonify(payload, status: int = 200):
+    """
+    Serialize a payload into a JSON response using orjson.
+
+    Parameters
+    ----------
+    payload : dict or list
+        JSON-serializable response content (numpy values included).
+    status : int
+        HTTP status code of the response.
+
+    Returns
+    -------
+    flask.Response
+        Response with an `application/json` body.
+    """
+    return json_bytes_response(orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY), status)
+
+
+def json_bytes_response(body: bytes, status: int = 200):
+    """
+    Wrap an already serialized JSON body into a response.
+
+    A new response object is built per call (after-request hooks such as
+    CORS add headers to it), but the body bytes are reused as-is.
+
+    Parameters
+    ----------
+    body : bytes
+        Serialized JSON content.
+    status : int
+        HTTP status code of the response.
+
+    Returns
+    -------
+    flask.Response
+        Response with an `application/json` body.
+    """
+    return app.response_class(body, status=status, mimetype="application/json")
+
+
+def read_json_body():
+    """
+    Parse the JSON body of the current request using orjson.
+
+    Returns
+    -------
+    dict or list or None
+        Parsed JSON content, or None if the request is not JSON or its
+        body is empty or malformed.
+    """
+    if not request.is_json:
+        return None
+
+    raw_body = request.get_data(cache=False)
+    if not raw_body:
+        return None
+
+    try:
+        return orjson.loads(raw_body)
+    except orjson.JSONDecodeError:
+        return None
+
+
 def load_model(path: str):
     """
     Load a machine learning model using joblib.
@@ -108,87 +222,183 @@ def load_model(path: str):
     object
         Loaded model object.
     """
+    import joblib
+
     try:
         return joblib.load(path)
     except Exception as e:
-        logger.error(f"Failed to load model: {e}")
+        logger.error("Failed to load model: %s", e)
         raise
 
 
-def build_input_dataframe(symptom_dict: dict) -> pd.DataFrame:
+def build_input_array(symptom_dict: dict) -> np.ndarray:
     """
-    Convert incoming symptom dictionary into a pandas DataFrame.
+    Encode an incoming symptom dictionary into the model's feature vector.
 
     Parameters
     ----------
     symptom_dict : dict
-        Dictionary of symptom_id → 0/1 or values.
+        Dictionary of symptom code → 0/1.
 
     Returns
     -------
-    pd.DataFrame
-        A single-row DataFrame suitable for model prediction.
+    np.ndarray
+        Array of shape (1, N_SYMPTOMS) in model feature column order.
+
+    Raises
+    ------
+    UnknownSymptomException
+        If a symptom code is not known to the model.
     """
+    symptom_count = len(symptom_dict)
     try:
-        df = pd.DataFrame([symptom_dict])
-        return df
-    except Exception as e:
-        logger.error(f"Error creating DataFrame: {e}")
-        raise
+        symptom_columns = np.fromiter(
+            (SYMPTOM_INDEX[code] for code in symptom_dict),
+            dtype=np.intp,
+            count=symptom_count
+        )
+    except KeyError as e:
+        raise UnknownSymptomException(f"Unknown symptom code: {e.args[0]}")
+
+    symptom_vector = EMPTY_SYMPTOM_VECTOR.copy()
+    symptom_vector[0, symptom_columns] = np.fromiter(
+        symptom_dict.values(),
+        dtype=np.int8,
+        count=symptom_count
+    )
+    return symptom_vector
 
 
-def enrich_predictions(predictions: list, disease_info: list):
+def predict_symptom_batch(symptom_matrix: np.ndarray) -> list:
     """
-    Enrich model predictions with additional disease metadata.
+    Run the ensemble model on a batch of encoded symptom vectors.
+
+    Parameters
+    ----------
+    symptom_matrix : np.ndarray
+        Array of shape (n_rows, N_SYMPTOMS) in model feature column order.
+
+    Returns
+    -------
+    list
+        One list of top 3 predictions per row.
+    """
+    return MODEL.predict_top3_batch(symptom_matrix)
+
+
+def build_disease_enrichment(disease_info: list, disease_names: dict) -> list:
+    """
+    Precompute the static part of the prediction entry of every disease.
 
     Parameters
     ----------
-    predictions : list
-        List of dicts returned by the model (disease + probability).
     disease_info : list
         List of disease metadata dictionaries.
+    disease_names : dict
+        Mapping of the model's disease ids to (title-cased) disease names.
 
     Returns
     -------
     list
-        Enriched list of prediction dictionaries.
+        List indexed by disease id, holding the "id", "name", "description"
+        and "precautions" fields of the response entry. Diseases without
+        metadata get an empty description and no precautions.
     """
-    enriched = []
-    disease_lookup = {d["id"]: d for d in disease_info}
+    disease_lookup = {disease["id"]: disease for disease in disease_info}
+    disease_enriched = [None] * (max(disease_names) + 1)
 
-    for prediction in predictions:
-        id = prediction['disease_id']
-        
-        extra = disease_lookup.get(id, {})
+    for id, name in disease_names.items():
+        disease = disease_lookup.get(id, {})
 
-        description = extra.get("description", "")
+        description = disease.get("description", "")
         precautions = [ 
-            extra.get("precaution1", ""), 
-            extra.get("precaution2", ""), 
-            extra.get("precaution3", ""), 
-            extra.get("precaution4", "") 
+            disease.get("precaution1", ""), 
+            disease.get("precaution2", ""), 
+            disease.get("precaution3", ""), 
+            disease.get("precaution4", "") 
         ]
-        
-        enriched.append({
+
+        disease_enriched[id] = {
             "id": str(id),
-            "name": prediction["disease"].title(),
+            "name": name,
             "description": description.capitalize(),
-            "precautions": [ precaution.capitalize() for precaution in precautions if len(precaution) > 0 ],
+            "precautions": [ precaution.capitalize() for precaution in precautions if len(precaution) > 0 ]
+        }
+
+    return disease_enriched
+
+
+def enrich_predictions(predictions: list):
+    """
+    Enrich model predictions with the disease metadata precomputed at startup.
+
+    Parameters
+    ----------
+    predictions : list
+        List of dicts returned by the model (disease + probability).
+
+    Returns
+    -------
+    list
+        Enriched list of prediction dictionaries.
+    """
+    return [
+        {
+            **DISEASE_ENRICHED[prediction['disease_id']],
             "probability": f"{prediction['probability']} %"
-        })
+        } for prediction in predictions
+    ]
+
+
+@functools.lru_cache(maxsize=int(os.environ.get("PREDICT_CACHE_SIZE", "4096")))
+def predict_response_body(symptom_key: bytes) -> bytes:
+    """
+    Predict, enrich and serialize the /predict success body, memoized.
+
+    Predictions are deterministic in the symptom vector, so the serialized
+    body is cached per vector and repeated symptom sets skip the models
+    entirely.
 
-    return enriched
+    Parameters
+    ----------
+    symptom_key : bytes
+        Symptom vector packed to bits with `np.packbits`.
+
+    Returns
+    -------
+    bytes
+        JSON body of the successful prediction response.
+    """
+    symptom_vector = np.unpackbits(
+        np.frombuffer(symptom_key, dtype=np.uint8),
+        count=N_SYMPTOMS
+    ).view(np.int8).reshape(1, N_SYMPTOMS)
+
+    # Run prediction (batched with concurrent requests)
+    predictions = PREDICTOR.predict(symptom_vector)
+
+    return orjson.dumps({
+        "success": True,
+        "predictions": enrich_predictions(predictions)
+    })
 
 
 # ---------------------------------------------------------
 # Load Resources at Startup
 # ---------------------------------------------------------
-@app.before_first_request
 def load_resources():
     """
     Load model and JSON data once when the Flask app starts.
+
+    Safe to call more than once: resources that are already loaded are
+    kept, so repeated calls do not load the model twice.
     """
-    global MODEL, DISEASE_INFO, SYMPTOM_INFO
+    global MODEL, PREDICTOR, DISEASE_INFO, SYMPTOM_INFO, DISEASE_ENRICHED
+    global SYMPTOMS_RESPONSE_BODY, SYMPTOMS_RESPONSE_ETAG
+    global SYMPTOM_INDEX, N_SYMPTOMS, EMPTY_SYMPTOM_VECTOR
+
+    if MODEL is not None and DISEASE_INFO is not None and SYMPTOM_INFO is not None:
+        return
 
     try:
         logger.info("Loading model and JSON data...")
@@ -197,64 +407,165 @@ def load_resources():
         DISEASE_INFO = load_json_file("./Data/Disease_Info.json")
         SYMPTOM_INFO = load_json_file("./Data/Symptoms_Info.json")
 
+        DISEASE_ENRICHED = build_disease_enrichment(DISEASE_INFO, MODEL.disease_id_name_map)
+
+        # Symptom code → model feature column. The model was trained on the
+        # unique symptom codes in first-seen order, so a repeated code keeps
+        # the column of its first occurrence.
+        SYMPTOM_INDEX = {}
+        for symptom in SYMPTOM_INFO:
+            SYMPTOM_INDEX.setdefault(symptom["code"], len(SYMPTOM_INDEX))
+        N_SYMPTOMS = len(SYMPTOM_INDEX)
+        EMPTY_SYMPTOM_VECTOR = np.zeros((1, N_SYMPTOMS), dtype=np.int8)
+
+        # The symptom list never changes, so serialize its response once
+        SYMPTOMS_RESPONSE_BODY = orjson.dumps({
+            "symptoms": [
+                {
+                    'id': str(symptom['id']),
+                    'name': symptom['name'],
+                    'code': symptom['code']
+                } for symptom in SYMPTOM_INFO
+            ]
+        })
+        SYMPTOMS_RESPONSE_ETAG = hashlib.sha1(SYMPTOMS_RESPONSE_BODY).hexdigest()
+
+        # Run one prediction so the compiled inference kernels are built
+        # here rather than on the first real request
+        predict_symptom_batch(EMPTY_SYMPTOM_VECTOR)
+
+        # Concurrent /predict requests share model calls. A batch holds at
+        # most one row per request thread (gunicorn.conf.py runs 4 per worker)
+        PREDICTOR = BatchedPredictor(
+            predict_symptom_batch,
+            max_batch_size=int(os.environ.get("PREDICT_MAX_BATCH_SIZE", "4")),
+            max_wait=float(os.environ.get("PREDICT_MAX_BATCH_WAIT_MS", "2")) / 1000,
+            timeout=float(os.environ.get("PREDICT_TIMEOUT_MS", "1000")) / 1000,
+            # The input vectors are built here from validated 0/1 values, so
+            # skip scikit-learn's NaN/inf scan. Its config is thread-local,
+            # hence set once in the batching thread that runs the models.
+            initializer=functools.partial(sklearn.set_config, assume_finite=True)
+        )
+
         logger.info("Resources loaded successfully.")
 
     except Exception as e:
-        logger.critical(f"Failed to initialize resources: {e}")
+        logger.critical("Failed to initialize resources: %s", e)
         raise
 
 
+# Load at import time so that gunicorn's `preload_app` loads the model once in
+# the master process and forked workers share it copy-on-write. Tooling that
+# only needs the app object can opt out with SKIP_PRELOAD=1.
+if os.environ.get("SKIP_PRELOAD") != "1":
+    load_resources()
+
+
 # ---------------------------------------------------------
 # Correlation IDs of Requests & Request/Response Logging Middleware
 # ---------------------------------------------------------
+def reset_correlation_ids():
+    """
+    Start a new correlation ID sequence for the current process.
+
+    Generated IDs are "<pid>-<counter>" in hex, unique within the running
+    service without reading random bytes on every request. Re-run in forked
+    gunicorn workers so each one uses its own pid and counter.
+    """
+    global CORRELATION_ID_PREFIX, CORRELATION_ID_COUNTER
+
+    CORRELATION_ID_PREFIX = f"{os.getpid():x}-"
+    CORRELATION_ID_COUNTER = itertools.count()
+
+
+reset_correlation_ids()
+os.register_at_fork(after_in_child=reset_correlation_ids)
+
+
 @app.before_request
 def add_correlation_id():
-    g.correlation_id = request.headers.get("X-Correlation-ID", str(uuid.uuid4()))
+    g.correlation_id = (
+        request.headers.get("X-Correlation-ID")
+        or f"{CORRELATION_ID_PREFIX}{next(CORRELATION_ID_COUNTER):x}"
+    )
 
 
 @app.before_request
 def log_request():
-    g.start_time = time.time()
-    logger.info(f"[REQUEST] {request.method} {request.path} - Body: {request.get_json(silent=True)}")
+    g.start_ns = time.perf_counter_ns()
+    logger.info(
+        "[REQUEST] %s %s - Content-Length: %s",
+        request.method, request.path, request.content_length
+    )
+    # Request bodies may hold personal data; only log (a prefix of) them
+    # when debugging
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("[REQUEST] Body: %s", request.get_data(as_text=True)[:512])
 
 
 @app.after_request
 def log_response(response):
-    start = getattr(g, "start_time", None)
-    if start is not None:
-        duration = round((time.time() - start) * 1000, 2)
+    if not logger.isEnabledFor(logging.INFO):
+        return response
+
+    start_ns = getattr(g, "start_ns", None)
+    if start_ns is not None:
+        duration = (time.perf_counter_ns() - start_ns) // 1_000_000
         logger.info(
-            f"[RESPONSE] {request.method} {request.path} - "
-            f"Status: {response.status_code} - Duration: {duration}ms"
+            "[RESPONSE] %s %s - Status: %s - Duration: %sms",
+            request.method, request.path, response.status_code, duration
         )
     else:
-        # No start_time → request was blocked early (rate limit, static, debugger)
+        # No start_ns → request was blocked early (rate limit, static, debugger)
         logger.info(
-            f"[RESPONSE] {request.method} {request.path} - "
-            f"Status: {response.status_code} - Duration: N/A"
+            "[RESPONSE] %s %s - Status: %s - Duration: N/A",
+            request.method, request.path, response.status_code
         )
 
     return response
 
 
 # ---------------------------------------------------------
-# API Request Data Validation Schema
+# API Request Data Validation
 # ---------------------------------------------------------
-class SymptomSchema(Schema):
-    symptoms = fields.Dict(
-        keys=fields.String(),
-        values=fields.Integer(),
-        required=True
-    )
+def validate_symptoms(json_data) -> dict:
+    """
+    Validate the `/predict` payload and return its symptom dictionary.
+
+    The payload is a flat mapping, so the types are checked inline rather
+    than through a generic marshmallow schema. Errors are still raised as a
+    marshmallow `ValidationError` with field-keyed messages, in the same
+    shape a schema would report them.
+
+    Parameters
+    ----------
+    json_data : object
+        Parsed JSON request body.
 
-class DiseaseInfoSchema(Schema):
-    name = fields.String(required=True)
-    description = fields.String(required=True)
-    precautions = fields.List(fields.String(), required=True)
-    severity = fields.String(required=True)
+    Returns
+    -------
+    dict
+        Dictionary of symptom code → 0/1.
+
+    Raises
+    ------
+    ValidationError
+        If the payload does not match the expected shape.
+    """
+    if not isinstance(json_data, dict) or "symptoms" not in json_data:
+        raise ValidationError({"symptoms": ["Missing data for required field."]})
+
+    symptoms = json_data["symptoms"]
+    if not isinstance(symptoms, dict):
+        raise ValidationError({"symptoms": ["Not a valid mapping type."]})
+
+    for symptom_code, is_present in symptoms.items():
+        # bool is a subclass of int; JSON true/false are not valid values
+        if type(is_present) is not int or is_present not in (0, 1):
+            raise ValidationError({"symptoms": {symptom_code: ["Must be the integer 0 or 1."]}})
+
+    return symptoms
 
-disease_info_schema = DiseaseInfoSchema(many=True)
-symptom_schema = SymptomSchema()
 
 # ---------------------------------------------------------
 # API Endpoint
@@ -288,22 +599,18 @@ def get_all_symptoms():
                     type: string
                   code:
                     type: string
+      304:
+        description: Symptoms data unchanged since the ETag sent in If-None-Match
       500:
         description: Internal server error
     """
-    symptom_data = {
-        "symptoms": [
-            {
-                'id': str(symptom['id']),
-                'name': symptom['name'],
-                'code': symptom['code']
-            } for symptom in SYMPTOM_INFO
-        ]
-    }
-    return jsonify(symptom_data), 200
+    response = json_bytes_response(SYMPTOMS_RESPONSE_BODY, 200)
+    response.set_etag(SYMPTOMS_RESPONSE_ETAG)
+    return response.make_conditional(request)
 
 
 @app.route("/api/predict", methods=["POST"])
+@limiter.limit("10/minute")
 def predict():
     """
     Predict top 3 probable diseases based on symptom input.
@@ -360,62 +667,24 @@ def predict():
       500:
         description: Internal server error
     """
-    response, status_code = None, None
-    
+    json_data = read_json_body()
+
+    if not json_data: 
+        return json_bytes_response(INVALID_JSON_BODY, 400)
+
     try:
-        json_data = request.get_json() 
-
-        if not json_data: 
-            response = {
-                "success": False, 
-                "error": { 
-                    "type": "BadRequest", 
-                    "message": "Invalid or missing JSON body." 
-                }
-            }
-            status_code = 400 
-        else:
-            # Validate and deserialize 
-            data = symptom_schema.load(json_data) 
-            request_symptom_dict = data["symptoms"]
-            
-            all_symptom_dict = { symptom["code"]: 0 for symptom in SYMPTOM_INFO } 
-
-            for request_symptom, is_present in request_symptom_dict.items():
-                if request_symptom in all_symptom_dict:
-                    all_symptom_dict[request_symptom] = is_present
-                else:
-                    raise UnknownSymptomException(f"Unknown symptom code: {request_symptom}")
-
-            # Convert to DataFrame
-            df_input = build_input_dataframe(all_symptom_dict)
-
-            # Run prediction
-            predictions = MODEL.predict_top3(df_input)
-
-            # Enrich with disease metadata
-            enriched_output = enrich_predictions(predictions, DISEASE_INFO)
-
-            response = {
-                "success": True,
-                "predictions": enriched_output
-            }
-            status_code = 200
-        
+        # Validate and deserialize 
+        request_symptom_dict = validate_symptoms(json_data)
     except ValidationError as ve: 
         # Input validation error (400) 
-        logger.warning(f"Validation error: {ve.messages}") 
-        response = {
-            "success": False, 
-            "error": { 
-                "type": "ValidationError", 
-                "message": "Invalid request payload."
-            } 
-        }
-        status_code = 400
+        logger.warning("Validation error: %s", ve.messages)
+        return json_bytes_response(INVALID_PAYLOAD_BODY, 400)
 
-    finally:
-        return jsonify(response), status_code
+    # Encode symptoms straight into the model's feature vector, packed to
+    # bits as the prediction cache key
+    symptom_key = np.packbits(build_input_array(request_symptom_dict)).tobytes()
+
+    return json_bytes_response(predict_response_body(symptom_key), 200)
 
 
 # ---------------------------------------------------------
@@ -427,28 +696,28 @@ def handle_http_exception(e):
     Handles all HTTP errors (400, 404, 405, etc.)
     Ensures consistent JSON output.
     """
-    logger.warning(f"HTTPException: {e.code} - {e.description}")
+    logger.warning("HTTPException: %s - %s", e.code, e.description)
 
-    return jsonify({
+    return ojsonify({
         "success": False,
         "error": {
             "type": e.__class__.__name__,
             "message": e.description
         }
-    }), e.code
+    }, e.code)
 
 
 @app.errorhandler(UnknownSymptomException)
 def handle_unknown_symptom(e):
-    logger.warning(f"UnknownSymptomException: {str(e)}")
+    logger.warning("UnknownSymptomException: %s", e)
 
-    return jsonify({
+    return ojsonify({
         "success": False,
         "error": {
             "type": "UnknownSymptomException",
             "message": str(e)
         }
-    }), 400
+    }, 400)
 
 
 @app.errorhandler(Exception)
@@ -456,21 +725,35 @@ def handle_unexpected_exception(e):
     """
     Handles all unexpected server errors.
     """
-    logger.error(f"Unhandled Exception: {str(e)}")
+    logger.error("Unhandled Exception: %s", e)
 
-    return jsonify({
-        "success": False,
-        "error": {
-            "type": "InternalServerError",
-            "message": "An unexpected error occurred. Please try again later."
-        }
-    }), 500
+    return json_bytes_response(INTERNAL_ERROR_BODY, 500)
 
 
 # ---------------------------------------------------------
 # Ready & Health API endpoint
 # ---------------------------------------------------------
+def is_ready() -> bool:
+    """
+    Whether the model, disease metadata and symptom metadata are all loaded.
+    """
+    return MODEL is not None and DISEASE_INFO is not None and SYMPTOM_INFO is not None
+
+
+def health_payload() -> dict:
+    """
+    Body of the liveness probe response.
+    """
+    return {
+        "success": True,
+        "status": "Ok",
+        "service": "disease-prediction-api",
+        "timestamp": time.time()
+    }
+
+
 @app.route("/ready")
+@limiter.exempt
 def ready():
     """
     Readiness probe endpoint.
@@ -488,12 +771,13 @@ def ready():
             200 OK  -> service is ready
             503 Service Unavailable -> service is not ready
     """
-    if MODEL is None or DISEASE_INFO is None or SYMPTOM_INFO is None:
-        return jsonify({"ready": False}), 503
-    return jsonify({"ready": True}), 200
+    if not is_ready():
+        return json_bytes_response(NOT_READY_BODY, 503)
+    return json_bytes_response(READY_BODY, 200)
 
 
 @app.route("/health", methods=["GET"])
+@limiter.exempt
 def health():
     """
     Liveness probe endpoint.
@@ -512,12 +796,62 @@ def health():
         HTTP Status:
             200 OK -> service is alive
     """
-    return jsonify({
-        "success": True,
-        "status": "Ok",
-        "service": "disease-prediction-api",
-        "timestamp": time.time()
-    }), 200
+    return ojsonify(health_payload(), 200)
+
+
+# ---------------------------------------------------------
+# Probe Fast Path (WSGI Middleware)
+# ---------------------------------------------------------
+def probe_middleware(wsgi_app):
+    """
+    Answer `GET /health` and `GET /ready` before Flask handles the request.
+
+    Orchestrators poll these endpoints constantly, and they need none of
+    the request machinery: routing, correlation IDs, request/response
+    logging or rate limiting. The CORS headers Flask-CORS would add for an
+    allowed origin are kept, so browser status pages still work. Any other
+    request is passed through to `wsgi_app` unchanged. The routes above
+    still serve other methods and document the endpoints in Swagger.
+
+    Parameters
+    ----------
+    wsgi_app : callable
+        The WSGI application to wrap.
+
+    Returns
+    -------
+    callable
+        WSGI application with the probe fast path.
+    """
+    def respond(environ, start_response, status, body):
+        headers = [
+            ("Content-Type", "application/json"),
+            ("Content-Length", str(len(body)))
+        ]
+        origin = environ.get("HTTP_ORIGIN")
+        if origin in cors_allowed_url_list:
+            headers.append(("Access-Control-Allow-Origin", origin))
+            headers.append(("Vary", "Origin"))
+
+        start_response(status, headers)
+        return [body]
+
+    def app_with_probes(environ, start_response):
+        if environ.get("REQUEST_METHOD") == "GET":
+            path = environ.get("PATH_INFO")
+            if path == "/health":
+                return respond(environ, start_response, "200 OK", orjson.dumps(health_payload()))
+            if path == "/ready":
+                if is_ready():
+                    return respond(environ, start_response, "200 OK", READY_BODY)
+                return respond(environ, start_response, "503 SERVICE UNAVAILABLE", NOT_READY_BODY)
+
+        return wsgi_app(environ, start_response)
+
+    return app_with_probes
+
+
+app.wsgi_app = probe_middleware(app.wsgi_app)
 
 
 # ---------------------------------------------------------
@@ -0,0 +1,130 @@
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future, TimeoutError
+
+import numpy as np
+
+
+class BatchedPredictor:
+    """
+    Micro-batches concurrent single-row predictions into one model call.
+
+    Request threads submit their encoded symptom vector and block on a
+    future. A background worker collects the rows that arrive within a short
+    window (up to `max_batch_size`), stacks them into one matrix, runs the
+    batch prediction once, and hands every caller its own result. Under
+    concurrent traffic the model's fixed per-call overhead is then paid once
+    per batch instead of once per request. A row that arrives to an empty
+    queue is predicted right away, without waiting for company.
+
+    The worker thread is started lazily by the first call in each process
+    (and restarted if it has died), so a predictor created before gunicorn
+    forks its workers still gets a worker (and a fresh queue) in every
+    worker process. A caller that gets no result within `timeout` predicts
+    its row directly instead of waiting on the worker forever.
+
+    Args:
+        predict_batch (callable): Maps an array of shape (n_rows, n_features)
+            to a list of n_rows per-row results.
+        max_batch_size (int): Maximum number of rows per model call. Each
+            waiting request thread contributes one row, so there is no point
+            in setting this above the number of request threads per process.
+        max_wait (float): Seconds to wait for more rows when other rows are
+            already queued behind the first one.
+        timeout (float): Seconds to wait for the worker before falling back
+            to a direct prediction.
+        initializer (callable): Optional, called once at the start of every
+            worker thread (e.g. to set thread-local library configuration).
+    """
+
+    def __init__(self, predict_batch, max_batch_size=4, max_wait=0.002, timeout=1.0,
+                 initializer=None):
+        self.predict_batch = predict_batch
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.timeout = timeout
+        self.initializer = initializer
+        self._lock = threading.Lock()
+        self._queue = None
+        self._thread = None
+        self._pid = None
+
+    def predict(self, row):
+        """
+        Predict a single row, batched together with any concurrent callers.
+
+        Args:
+            row (numpy.ndarray): Array of shape (1, n_features).
+
+        Returns:
+            The result for this row, as returned by `predict_batch`.
+
+        Raises:
+            Exception: Whatever `predict_batch` raised for the batch.
+        """
+        future = Future()
+        self._get_queue().put((row, future))
+        try:
+            return future.result(timeout=self.timeout)
+        except TimeoutError:
+            # The worker is stuck or gone; withdraw the row (if it has not
+            # been picked up yet) and predict it on this thread
+            future.cancel()
+            return self.predict_batch(row)[0]
+
+    def _get_queue(self):
+        pid = os.getpid()
+        if self._pid != pid or not self._thread.is_alive():
+            with self._lock:
+                if self._pid != pid or not self._thread.is_alive():
+                    self._queue = queue.Queue()
+                    self._thread = threading.Thread(
+                        target=self._run,
+                        args=(self._queue,),
+                        name="batched-predictor",
+                        daemon=True
+                    )
+                    self._thread.start()
+                    self._pid = pid
+        return self._queue
+
+    def _collect(self, pending):
+        batch = [pending.get()]
+        if pending.empty():
+            return batch
+
+        deadline = time.monotonic() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(pending.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self, pending):
+        if self.initializer is not None:
+            self.initializer()
+
+        while True:
+            # Skip rows whose caller already gave up waiting
+            batch = [
+                (row, future) for row, future in self._collect(pending)
+                if future.set_running_or_notify_cancel()
+            ]
+            if not batch:
+                continue
+
+            rows, futures = zip(*batch)
+            try:
+                results = self.predict_batch(np.vstack(rows))
+            except Exception as e:
+                for future in futures:
+                    future.set_exception(e)
+            else:
+                for future, result in zip(futures, results):
+                    future.set_result(result)
@@ -1,3 +1,10 @@
+import copy
+
+import numpy as np
+
+from numba_kernels import NUMBA_AVAILABLE, pack_forest, forest_predict_proba, combine_top3
+
+
 class DiseaseEnsemble:
     """
     Ensemble model wrapper for disease prediction.
@@ -7,11 +14,17 @@ class DiseaseEnsemble:
     stable and reliable probability distribution over possible diseases.
     Each model is expected to implement `predict_proba`.
 
+    When numba is available, the Random Forest is not evaluated through
+    scikit-learn: its trees are packed into flat arrays once and traversed
+    by a compiled kernel, which avoids scikit-learn's per-call validation
+    and per-tree Python dispatch.
+
     Args:
         gnb: Trained Gaussian Naive Bayes classifier.
         rf: Trained Random Forest classifier.
         svm: Trained Support Vector Machine classifier with probability=True.
         disease_id_name_map (dict): Mapping of class indices to disease names.
+            Names are stored title-cased, as they are returned by `predict_top3`.
     """
 
     def __init__(self, gnb, rf, svm, disease_id_name_map):
@@ -19,13 +32,100 @@ class DiseaseEnsemble:
         self.rf = rf
         self.svm = svm
         self.disease_id_name_map = disease_id_name_map
+        self._prepare()
+
+    def __getstate__(self):
+        # The packed forest is derived from `rf`; keep it out of the pickle
+        state = self.__dict__.copy()
+        state.pop("_packed_rf", None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._prepare()
+
+    def _prepare(self):
+        """
+        Derive the prediction-time state from the fitted models.
+
+        The models are fitted on a DataFrame but predict on plain arrays in
+        training column order, so the ensemble keeps shallow copies of them
+        without the fitted feature names (which would otherwise trigger a
+        feature-name check and warning on every call). The caller's models
+        are left untouched, and the copies share their fitted arrays.
+        Disease names are title-cased once here instead of on every
+        prediction, and the Random Forest is packed for the compiled kernel.
+        """
+        # Also covers pickles saved before names were normalized at load time
+        self.disease_id_name_map = {
+            disease_id: name.title() for disease_id, name in self.disease_id_name_map.items()
+        }
+
+        self.gnb, self.rf, self.svm = (
+            self._without_feature_names(model) for model in (self.gnb, self.rf, self.svm)
+        )
+
+        # The top-3 selection needs at least 3 classes, and every selected
+        # class index must map to a disease name
+        n_classes = len(self.disease_id_name_map)
+        if n_classes < 3:
+            raise ValueError(f"DiseaseEnsemble needs at least 3 disease classes, got {n_classes}")
+        for model in (self.gnb, self.rf, self.svm):
+            if len(model.classes_) != n_classes:
+                raise ValueError(
+                    f"{type(model).__name__} has {len(model.classes_)} classes, "
+                    f"expected {n_classes} (one per disease)"
+                )
+
+        self._packed_rf = pack_forest(self.rf) if NUMBA_AVAILABLE else None
+
+    @staticmethod
+    def _without_feature_names(model):
+        """
+        Shallow copy of a fitted model without its `feature_names_in_`.
+        """
+        if not hasattr(model, "feature_names_in_"):
+            return model
+        model = copy.copy(model)
+        del model.feature_names_in_
+        return model
+
+    def _rf_predict_proba(self, X):
+        """
+        Random Forest class probabilities, using the packed forest if available.
+        """
+        if self._packed_rf is None:
+            return self.rf.predict_proba(X).astype(np.float32, copy=False)
+        return forest_predict_proba(np.asarray(X, dtype=np.float32), *self._packed_rf)
+
+    @staticmethod
+    def _combine_top3(p1, p2, p3):
+        """
+        Summed probabilities of the top 3 classes per row, best first.
+
+        Uses the fused compiled kernel when numba is available, and NumPy
+        otherwise.
+        """
+        if NUMBA_AVAILABLE:
+            return combine_top3(p1, p2, p3)
+
+        # Sum the probabilities in place in float32 (ranking and a 2-decimal
+        # percentage do not need double precision)
+        combined = p1.astype(np.float32, copy=False)
+        np.add(combined, p2, out=combined, casting="same_kind")
+        np.add(combined, p3, out=combined, casting="same_kind")
+
+        # Order by descending probability with a stable sort, so ties keep
+        # the lower class index first, as in the compiled kernel
+        top = np.argsort(-combined, axis=1, kind="stable")[:, :3]
+        return top, np.take_along_axis(combined, top, axis=1)
 
     def predict_top3(self, X):
         """
         Predict the top 3 most likely diseases for a given symptom vector.
         
         This method:
-        - Accepts a pandas DataFrame containing a single row of symptom features.
+        - Accepts a numpy array (or DataFrame) with a single row of symptom features.
         - Computes class probabilities from all three ensemble models
         (GaussianNB, RandomForest, SVM).
         - Averages the probability distributions to form an ensemble output.
@@ -34,8 +134,8 @@ class DiseaseEnsemble:
         - Returns probabilities as percentages (0 - 100).
 
         Args:
-            X (pandas.DataFrame):
-                A DataFrame of shape (1, n_features) representing the encoded
+            X (numpy.ndarray or pandas.DataFrame):
+                An array of shape (1, n_features) representing the encoded
                 symptom vector. Column order must match the model's training data.
 
         Returns:
@@ -52,23 +152,51 @@ class DiseaseEnsemble:
             ]
         """
 
+        return self.predict_top3_batch(X)[0]
+
+    def predict_top3_batch(self, X):
+        """
+        Predict the top 3 most likely diseases for every row of X.
+
+        Same as `predict_top3`, but for a batch of symptom vectors: the three
+        models are each called once for the whole batch, so their fixed
+        per-call overhead is shared by all rows.
+
+        Args:
+            X (numpy.ndarray or pandas.DataFrame):
+                An array of shape (n_rows, n_features) of encoded symptom
+                vectors. Column order must match the model's training data.
+
+        Returns:
+            list[list[dict]]: One `predict_top3` style result per row of X.
+        """
+
+        # Convert once to the contiguous float64 layout the models were
+        # fitted on, so scikit-learn's input validation has nothing to copy
+        X = np.ascontiguousarray(X, dtype=np.float64)
+
         # Ensure all models return probabilities
         p1 = self.gnb.predict_proba(X)
-        p2 = self.rf.predict_proba(X)
+        p2 = self._rf_predict_proba(X)
         p3 = self.svm.predict_proba(X)
 
-        # Combine probabilities
-        combined = (p1 + p2 + p3) / 3
-
-        # Get top 3 indices
-        idx = combined[0].argsort()[::-1][:3]
-        probs = combined[0][idx]
-
-        # Map to disease names
-        return [
-            {
-                "disease_id": i,
-                "disease": self.disease_id_name_map[i].title(), 
-                "probability": round(float(probs[j] * 100), 2)
-            } for j, i in enumerate(idx)
-        ]
+        # The average is only taken on the selected values, since dividing
+        # by 3 does not change the ranking
+        top, top_scores = self._combine_top3(p1, p2, p3)
+
+        # Percentages rounded to 2 decimals, converted to Python numbers in
+        # one pass instead of per value
+        top_percent = np.round(top_scores.astype(np.float64) * (100 / 3), 2).tolist()
+
+        results = []
+        for idx, probs in zip(top.tolist(), top_percent):
+            # Map to disease names
+            results.append([
+                {
+                    "disease_id": i,
+                    "disease": self.disease_id_name_map[i],
+                    "probability": probs[j]
+                } for j, i in enumerate(idx)
+            ])
+
+        return results
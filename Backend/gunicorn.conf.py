@@ -0,0 +1,27 @@
+"""
+Gunicorn configuration for the disease prediction API.
+
+Usage:
+    gunicorn app:app
+
+`preload_app` imports the app (and with it loads the model) once in the
+master process before forking, so every worker shares the same model
+memory copy-on-write instead of loading its own copy.
+
+Inference is CPU-bound and runs the three models one after another on a
+single batching thread per worker, so one worker per core keeps every core
+busy without oversubscribing them (the `2 * cores + 1` rule is meant for
+I/O-bound workers). Each worker runs a few request threads, which mostly
+wait on the batching thread and let concurrent requests be micro-batched
+into one model call. Avoid the gevent/eventlet worker classes:
+monkey-patching cannot make scikit-learn's C extensions cooperative.
+"""
+import multiprocessing
+
+bind = "0.0.0.0:5000"
+
+workers = multiprocessing.cpu_count()
+worker_class = "gthread"
+threads = 4
+
+preload_app = True
@@ -1,4 +1,8 @@
+import atexit
 import logging
+import os
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from flask import g, has_request_context
 
 class CorrelationIdFilter(logging.Filter):
@@ -7,8 +11,9 @@ class CorrelationIdFilter(logging.Filter):
 
     This filter checks whether the current execution is inside a Flask
     request context. If so, it retrieves `g.correlation_id` (set earlier
-    in the request lifecycle). If not available, or if no request context
-    exists (e.g., during app startup), it defaults to "N/A".
+    in the request lifecycle), defaulting to "N/A" if it is not available.
+    Outside a request context (e.g., during app startup) the record keeps
+    the "N/A" it was created with (see `install_correlation_id_default`).
 
     Adding this filter ensures that all logs—application logs, errors,
     and access logs—carry a consistent correlation ID, making it easier
@@ -18,32 +23,52 @@ class CorrelationIdFilter(logging.Filter):
     def filter(self, record):
         if has_request_context():
             record.correlation_id = getattr(g, "correlation_id", "N/A")
-        else:
-            record.correlation_id = "N/A"
         return True
 
 
-class SafeFormatter(logging.Formatter):
+def install_correlation_id_default():
     """
-    Custom log formatter that safely handles missing correlation IDs.
+    Make every log record carry a `correlation_id` from the moment it is created.
 
-    This formatter extends Python's standard logging.Formatter but ensures
-    that the `correlation_id` attribute always exists on the log record.
-    This prevents formatting errors when logs are generated outside a
-    request context or before the CorrelationIdFilter is applied.
+    Wraps the current log record factory so new records start with
+    `correlation_id = "N/A"`. The log format can then reference the field
+    unconditionally, even for records that never pass through
+    CorrelationIdFilter (e.g., logged before the filter is attached or by
+    other libraries' handlers).
+    """
+    base_factory = logging.getLogRecordFactory()
 
-    Args:
-        fmt (str): Log message format string.
-        datefmt (str): Optional date format string.
+    def record_factory(*args, **kwargs):
+        record = base_factory(*args, **kwargs)
+        record.correlation_id = "N/A"
+        return record
+
+    logging.setLogRecordFactory(record_factory)
+
+
+def start_queue_listener(queue_handler, *handlers):
     """
+    Start a background listener that drains `queue_handler` into `handlers`.
+
+    A fresh queue is attached to the queue handler on every call, so this is
+    also used to restart the listener in forked worker processes, which do
+    not inherit the parent's listener thread. The listener is stopped at
+    interpreter exit, which flushes any records still queued.
+
+    Args:
+        queue_handler (QueueHandler): Handler that request threads log to.
+        *handlers (logging.Handler): Handlers performing the actual I/O.
 
-    def __init__(self, fmt=None, datefmt=None):
-        super().__init__(fmt=fmt, datefmt=datefmt, style="{")
+    Returns:
+        QueueListener: The started listener.
+    """
+    log_queue = queue.Queue(-1)
+    queue_handler.queue = log_queue
 
-    def format(self, record):
-        if not hasattr(record, "correlation_id"):
-            record.correlation_id = "N/A"
-        return super().format(record)
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
 
 
 def configure_logger():
@@ -52,8 +77,12 @@ def configure_logger():
 
     This function:
     - Defines a structured log format including timestamp, level, and correlation ID.
-    - Initializes Python's root logger with INFO level and a StreamHandler.
-    - Applies SafeFormatter to ensure logs never break due to missing fields.
+    - Initializes Python's root logger with INFO level and a QueueHandler, so
+      request threads only enqueue records.
+    - Writes the queued records to a StreamHandler from a background
+      QueueListener thread, keeping stderr I/O off the request path.
+    - Installs a log record factory that defaults the correlation ID, so the
+      format never breaks due to a missing field.
     - Attaches CorrelationIdFilter so every log record includes a correlation ID.
 
     Returns:
@@ -66,18 +95,23 @@ def configure_logger():
 
     LOG_FORMAT = "{asctime} - [{levelname}] - [CID={correlation_id}] - {message}"
 
-    logging.basicConfig(
-        level=logging.INFO,
-        format=LOG_FORMAT,
-        style="{",
-        handlers=[logging.StreamHandler()]
-    )
+    install_correlation_id_default()
+
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter(LOG_FORMAT, style="{"))
+
+    # The filter reads the Flask request context, so it must run in the
+    # logging thread (on the QueueHandler), not in the listener thread.
+    queue_handler = QueueHandler(queue.Queue(-1))
+    queue_handler.addFilter(CorrelationIdFilter())
 
     logger = logging.getLogger()
-    safe_formatter = SafeFormatter(LOG_FORMAT)
+    logger.setLevel(logging.INFO)
+    logger.addHandler(queue_handler)
 
-    for handler in logger.handlers:
-        handler.setFormatter(safe_formatter)
-        handler.addFilter(CorrelationIdFilter())
+    start_queue_listener(queue_handler, stream_handler)
+    os.register_at_fork(
+        after_in_child=lambda: start_queue_listener(queue_handler, stream_handler)
+    )
 
     return logger
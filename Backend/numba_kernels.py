@@ -0,0 +1,146 @@
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for `numba.njit` so this module stays importable."""
+        def decorator(func):
+            return func
+        return decorator
+
+
+def pack_forest(forest):
+    """
+    Flatten the decision trees of a fitted random forest into flat arrays.
+
+    All trees are concatenated into one node table, so a single compiled
+    kernel can walk the whole forest without going back to Python for each
+    tree. Child indices are rebased onto the concatenated table, and leaf
+    class counts are normalized to probabilities the same way
+    `DecisionTreeClassifier.predict_proba` does, and stored as float32.
+
+    Args:
+        forest: Fitted `RandomForestClassifier` (single output).
+
+    Returns:
+        tuple: (children_left, children_right, feature, threshold,
+        leaf_proba, tree_roots), ready to be passed to
+        `forest_predict_proba`.
+    """
+    children_left, children_right = [], []
+    feature, threshold, leaf_proba, tree_roots = [], [], [], []
+    offset = 0
+
+    for estimator in forest.estimators_:
+        tree = estimator.tree_
+        is_leaf = tree.children_left == -1
+
+        children_left.append(np.where(is_leaf, -1, tree.children_left + offset))
+        children_right.append(np.where(is_leaf, -1, tree.children_right + offset))
+        feature.append(tree.feature)
+        threshold.append(tree.threshold)
+
+        value = tree.value[:, 0, :]
+        normalizer = value.sum(axis=1, keepdims=True)
+        normalizer[normalizer == 0.0] = 1.0
+        leaf_proba.append(value / normalizer)
+
+        tree_roots.append(offset)
+        offset += tree.node_count
+
+    return (
+        np.ascontiguousarray(np.concatenate(children_left), dtype=np.int64),
+        np.ascontiguousarray(np.concatenate(children_right), dtype=np.int64),
+        np.ascontiguousarray(np.concatenate(feature), dtype=np.int64),
+        np.ascontiguousarray(np.concatenate(threshold), dtype=np.float64),
+        np.ascontiguousarray(np.concatenate(leaf_proba), dtype=np.float32),
+        np.asarray(tree_roots, dtype=np.int64),
+    )
+
+
+@njit(cache=True, nogil=True)
+def forest_predict_proba(X, children_left, children_right, feature, threshold, leaf_proba, tree_roots):
+    """
+    Average the leaf class probabilities of a packed forest for every row of X.
+
+    Equivalent to `RandomForestClassifier.predict_proba` on the forest the
+    arrays were packed from (see `pack_forest`).
+    Runs without holding the GIL, so it can overlap with other threads.
+
+    Args:
+        X (numpy.ndarray): float32 array of shape (n_samples, n_features).
+
+    Returns:
+        numpy.ndarray: float32 array of shape (n_samples, n_classes).
+    """
+    n_samples = X.shape[0]
+    n_trees = tree_roots.shape[0]
+    n_classes = leaf_proba.shape[1]
+    proba = np.zeros((n_samples, n_classes), dtype=np.float32)
+
+    for i in range(n_samples):
+        for t in range(n_trees):
+            node = tree_roots[t]
+            while children_left[node] != -1:
+                if X[i, feature[node]] <= threshold[node]:
+                    node = children_left[node]
+                else:
+                    node = children_right[node]
+
+            for c in range(n_classes):
+                proba[i, c] += leaf_proba[node, c]
+
+        for c in range(n_classes):
+            proba[i, c] /= n_trees
+
+    return proba
+
+
+@njit(cache=True, nogil=True)
+def combine_top3(p1, p2, p3):
+    """
+    Sum three class-probability matrices and pick the top 3 classes per row.
+
+    Fuses the combine step and the top-3 selection into one pass over the
+    classes: the sum is accumulated in float32 and the 3 best classes are
+    kept in descending order as it goes, so no combined matrix is allocated
+    and no class is sorted. Ties keep the lower class index first.
+
+    Args:
+        p1, p2, p3 (numpy.ndarray): Non-negative float arrays of shape
+            (n_samples, n_classes), with n_classes >= 3 (checked when
+            `DiseaseEnsemble` is built). Every sum then beats the -1
+            sentinel, so all 3 returned indices are valid classes.
+
+    Returns:
+        tuple: (top, top_scores) - int64 class indices and their float32
+        summed probabilities, both of shape (n_samples, 3), best first.
+    """
+    n_samples, n_classes = p1.shape
+    top = np.empty((n_samples, 3), dtype=np.int64)
+    top_scores = np.empty((n_samples, 3), dtype=np.float32)
+
+    for i in range(n_samples):
+        i0, i1, i2 = -1, -1, -1
+        s0 = s1 = s2 = np.float32(-1.0)
+
+        for c in range(n_classes):
+            s = np.float32(p1[i, c]) + np.float32(p2[i, c]) + np.float32(p3[i, c])
+            if s > s0:
+                i2, s2 = i1, s1
+                i1, s1 = i0, s0
+                i0, s0 = c, s
+            elif s > s1:
+                i2, s2 = i1, s1
+                i1, s1 = c, s
+            elif s > s2:
+                i2, s2 = c, s
+
+        top[i, 0], top[i, 1], top[i, 2] = i0, i1, i2
+        top_scores[i, 0], top_scores[i, 1], top_scores[i, 2] = s0, s1, s2
+
+    return top, top_scores
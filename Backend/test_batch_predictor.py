@@ -0,0 +1,206 @@
+"""
+Tests for the request micro-batcher in batch_predictor.py.
+
+The batcher is exercised with trivial batch functions (row sums, optionally
+held back by an Event) so that batching, fallback and restart behaviour can
+be checked without loading the models.
+
+Usage (from the Backend directory):
+    python -m pytest -q
+"""
+import os
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from batch_predictor import BatchedPredictor
+
+
+def make_row(value):
+    return np.full((1, 4), value, dtype=np.float64)
+
+
+def row_sums(X):
+    return X.sum(axis=1).tolist()
+
+
+def wait_until(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not met in time")
+        time.sleep(0.001)
+
+
+def in_worker():
+    return threading.current_thread().name == "batched-predictor"
+
+
+class GatedBatch:
+    """
+    Row-sum batch function that records the batches run by the worker and
+    holds the worker on `gate` while it predicts a row whose values equal
+    `blocked_value`.
+    """
+
+    def __init__(self, blocked_value=None, error=None):
+        self.blocked_value = blocked_value
+        self.error = error
+        self.gate = threading.Event()
+        self.blocked = threading.Event()
+        self.worker_batches = []
+
+    def __call__(self, X):
+        if in_worker():
+            self.worker_batches.append(X[:, 0].tolist())
+            if self.blocked_value in X[:, 0]:
+                self.blocked.set()
+                self.gate.wait()
+        if self.error is not None:
+            raise self.error
+        return row_sums(X)
+
+
+def predict_in_threads(predictor, values):
+    results = {}
+
+    def call(value):
+        try:
+            results[value] = predictor.predict(make_row(value))
+        except Exception as e:
+            results[value] = e
+
+    threads = [threading.Thread(target=call, args=(value,)) for value in values]
+    for thread in threads:
+        thread.start()
+    return threads, results
+
+
+def test_lone_row_is_predicted_without_waiting_for_company():
+    predictor = BatchedPredictor(row_sums, max_wait=5.0)
+
+    start = time.monotonic()
+    assert predictor.predict(make_row(1)) == 4
+    assert time.monotonic() - start < 1.0
+
+
+def test_queued_rows_share_one_batch_and_get_their_own_results():
+    batch = GatedBatch(blocked_value=1)
+    predictor = BatchedPredictor(batch, max_batch_size=3, max_wait=1.0, timeout=5.0)
+
+    first, results = predict_in_threads(predictor, [1])
+    batch.blocked.wait(5.0)
+    queued, queued_results = predict_in_threads(predictor, [2, 3, 4])
+    wait_until(lambda: predictor._queue.qsize() == 3)
+    batch.gate.set()
+
+    for thread in first + queued:
+        thread.join(5.0)
+    results.update(queued_results)
+
+    assert results == {1: 4, 2: 8, 3: 12, 4: 16}
+    assert batch.worker_batches[0] == [1]
+    assert sorted(batch.worker_batches[1]) == [2, 3, 4]
+
+
+def test_batch_error_is_raised_in_every_waiting_request():
+    error = ValueError("model failed")
+    batch = GatedBatch(blocked_value=1, error=error)
+    predictor = BatchedPredictor(batch, max_batch_size=3, max_wait=1.0, timeout=5.0)
+
+    first, results = predict_in_threads(predictor, [1])
+    batch.blocked.wait(5.0)
+    queued, queued_results = predict_in_threads(predictor, [2, 3, 4])
+    wait_until(lambda: predictor._queue.qsize() == 3)
+    batch.gate.set()
+
+    for thread in first + queued:
+        thread.join(5.0)
+    results.update(queued_results)
+
+    assert results == {1: error, 2: error, 3: error, 4: error}
+
+
+def test_stuck_worker_falls_back_to_direct_prediction():
+    batch = GatedBatch(blocked_value=1)
+    predictor = BatchedPredictor(batch, timeout=0.05)
+
+    try:
+        assert predictor.predict(make_row(1)) == 4
+        assert batch.blocked.is_set()
+    finally:
+        batch.gate.set()
+
+
+def test_withdrawn_row_is_skipped_by_the_worker():
+    batch = GatedBatch(blocked_value=1)
+    predictor = BatchedPredictor(batch, max_wait=0.05, timeout=0.2)
+
+    # Row 1 holds the worker; row 2 queues behind it, times out and is
+    # predicted directly by its caller
+    assert predictor.predict(make_row(1)) == 4
+    assert predictor.predict(make_row(2)) == 8
+    batch.gate.set()
+
+    assert predictor.predict(make_row(3)) == 12
+    assert batch.worker_batches == [[1], [3]]
+
+
+@pytest.mark.filterwarnings("ignore::pytest.PytestUnhandledThreadExceptionWarning")
+def test_worker_is_restarted_after_it_dies():
+    def die_once(X):
+        if in_worker() and not died.is_set():
+            died.set()
+            raise SystemExit
+        return row_sums(X)
+
+    died = threading.Event()
+    predictor = BatchedPredictor(die_once, timeout=0.05)
+
+    assert predictor.predict(make_row(1)) == 4
+    dead_thread = predictor._thread
+    dead_thread.join(5.0)
+    assert not dead_thread.is_alive()
+
+    assert predictor.predict(make_row(2)) == 8
+    assert predictor._thread is not dead_thread
+    assert predictor._thread.is_alive()
+
+
+def test_worker_and_queue_are_recreated_after_fork(monkeypatch):
+    predictor = BatchedPredictor(row_sums)
+    assert predictor.predict(make_row(1)) == 4
+    parent_thread, parent_queue = predictor._thread, predictor._queue
+
+    child_pid = os.getpid() + 1
+    monkeypatch.setattr(os, "getpid", lambda: child_pid)
+
+    assert predictor.predict(make_row(2)) == 8
+    assert predictor._pid == child_pid
+    assert predictor._thread is not parent_thread
+    assert predictor._queue is not parent_queue
+
+
+def test_initializer_runs_once_in_the_worker_thread():
+    calls = []
+    predictor = BatchedPredictor(
+        row_sums, initializer=lambda: calls.append(threading.current_thread().name)
+    )
+
+    predictor.predict(make_row(1))
+    predictor.predict(make_row(2))
+
+    assert calls == ["batched-predictor"]
+
+
+@pytest.mark.parametrize("values", [[1, 2], [1, 2, 3, 4, 5, 6, 7, 8]])
+def test_concurrent_callers_get_their_own_results(values):
+    predictor = BatchedPredictor(row_sums, max_batch_size=4)
+
+    threads, results = predict_in_threads(predictor, values)
+    for thread in threads:
+        thread.join(5.0)
+
+    assert results == {value: 4 * value for value in values}
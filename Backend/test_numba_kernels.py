@@ -0,0 +1,79 @@
+"""
+Tests for the compiled inference kernels in numba_kernels.py.
+
+The kernels re-implement parts of scikit-learn's prediction by hand, so they
+are checked against scikit-learn (and the NumPy fallback) directly.
+
+Usage (from the Backend directory):
+    python -m pytest -q
+"""
+import numpy as np
+import pytest
+from sklearn.ensemble import RandomForestClassifier
+
+from disease_ensemble import DiseaseEnsemble
+from numba_kernels import pack_forest, forest_predict_proba, combine_top3
+
+
+def fit_forest(X, y, **params):
+    forest = RandomForestClassifier(n_estimators=25, random_state=0, **params)
+    return forest.fit(X, y)
+
+
+@pytest.mark.parametrize("params", [{}, {"max_depth": 3}, {"min_samples_leaf": 5}])
+def test_forest_predict_proba_matches_sklearn_on_binary_features(params):
+    rng = np.random.default_rng(0)
+    X = (rng.random((400, 30)) < 0.2).astype(np.float64)
+    y = rng.integers(0, 6, size=400)
+    forest = fit_forest(X, y, **params)
+
+    X_test = (rng.random((200, 30)) < 0.2).astype(np.float64)
+    expected = forest.predict_proba(X_test)
+    actual = forest_predict_proba(X_test.astype(np.float32), *pack_forest(forest))
+
+    assert actual.shape == expected.shape
+    np.testing.assert_allclose(actual, expected, atol=1e-6)
+
+
+def test_forest_predict_proba_matches_sklearn_on_continuous_features():
+    rng = np.random.default_rng(1)
+    X = rng.normal(size=(300, 8))
+    y = (X[:, 0] + X[:, 1] > 0).astype(int) + (X[:, 2] > 1).astype(int)
+    forest = fit_forest(X, y)
+
+    X_test = rng.normal(size=(200, 8))
+    expected = forest.predict_proba(X_test)
+    actual = forest_predict_proba(X_test.astype(np.float32), *pack_forest(forest))
+
+    np.testing.assert_allclose(actual, expected, atol=1e-6)
+
+
+def random_probabilities(rng, n_samples, n_classes):
+    p = rng.random((n_samples, n_classes))
+    return p / p.sum(axis=1, keepdims=True)
+
+
+def test_combine_top3_matches_numpy_fallback(monkeypatch):
+    rng = np.random.default_rng(2)
+    p1, p3 = (random_probabilities(rng, 100, 41) for _ in range(2))
+    p2 = random_probabilities(rng, 100, 41).astype(np.float32)
+
+    top, top_scores = combine_top3(p1, p2, p3)
+
+    monkeypatch.setattr("disease_ensemble.NUMBA_AVAILABLE", False)
+    expected_top, expected_scores = DiseaseEnsemble._combine_top3(p1, p2, p3)
+
+    np.testing.assert_array_equal(top, expected_top)
+    np.testing.assert_allclose(top_scores, expected_scores, rtol=1e-6)
+
+
+def test_combine_top3_breaks_ties_by_lowest_class_index(monkeypatch):
+    p = np.zeros((2, 6), dtype=np.float32)
+    p[:, [1, 3, 4, 5]] = 0.25
+
+    top, _ = combine_top3(p, p, p)
+    np.testing.assert_array_equal(top, [[1, 3, 4], [1, 3, 4]])
+
+    monkeypatch.setattr("disease_ensemble.NUMBA_AVAILABLE", False)
+    fallback_top, _ = DiseaseEnsemble._combine_top3(p, p, p)
+    np.testing.assert_array_equal(fallback_top, top)